@@ -1,14 +1,28 @@
+import functools
 import tomllib
+from pathlib import Path
+
 import xdg_base_dirs as xdg
 
 
 def load_config() -> dict:
-    """Load the source configuration toml file."""
+    """Load the source configuration toml file.
+
+    The parsed config is cached until the file's modification time changes,
+    so the returned mapping is shared and should be treated as read-only.
+    """
     # TODO: Support windows application paths?
     path = xdg.xdg_config_home() / "urdaemon" / "config.toml"
-    if path.exists():
-        with path.open("rb") as fp:
-            config = tomllib.load(fp)
-    else:
-        config = {}
-    return config
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _load_toml(path, mtime)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_toml(path: Path, mtime: int) -> dict:
+    """Parse the toml file at the path. The mtime only serves to
+    invalidate the cache when the file changes."""
+    with path.open("rb") as fp:
+        return tomllib.load(fp)
@@ -1,9 +1,58 @@
 import asyncio
+import logging
+
+log = logging.getLogger(__name__)
+
+
+class _BufferedStreamReaderProtocol(
+    asyncio.StreamReaderProtocol, asyncio.BufferedProtocol
+):
+    """Stream reader protocol that has the transport receive into a single
+    preallocated buffer rather than allocating a new bytes object per read.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, buffer_size: int):
+        super().__init__(reader)
+        self._view = memoryview(bytearray(buffer_size))
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._view
+
+    def buffer_updated(self, nbytes: int):
+        # The reader copies the data into its own buffer, so the view can
+        # be reused for the next read.
+        self.data_received(self._view[:nbytes])
+
+
+async def open_connection(
+    host: str, port: int, buffer_size: int = 65536
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """A drop-in for asyncio.open_connection whose transport reads into a
+    preallocated buffer of the given size.
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(loop=loop)
+    transport, protocol = await loop.create_connection(
+        lambda: _BufferedStreamReaderProtocol(reader, buffer_size), host, port
+    )
+    writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+    return reader, writer
 
 
 class Connection:
     """Base class representing a high-level async stream to a game server."""
 
+    __slots__ = (
+        'reader',
+        'writer',
+        'read_separator',
+        'write_separator',
+        'encoding',
+        'quit_command',
+        '_open',
+        '_quit_bytes',
+    )
+
     def __init__(self,
                  reader: asyncio.StreamReader,
                  writer: asyncio.StreamWriter,
@@ -34,6 +83,9 @@ class Connection:
         self.encoding = encoding
         self.quit_command = quit_command
         self._open: bool = True
+        # The write separator is already bytes and is written as-is, so the
+        # quit message can be fully encoded once up front.
+        self._quit_bytes: bytes = quit_command.encode(encoding) + write_separator
 
     async def read(self) -> str:
         """Read a message from the game server."""
@@ -55,8 +107,10 @@ class Connection:
 
     async def write(self, text: str):
         """Send a message (e.g., a command) to the game server."""
-        msg: bytes = text.encode(self.encoding) + self.write_separator
-        self.writer.write(msg)
+        # Hand the separator to the transport separately. On Python 3.12+
+        # this avoids copying the encoded message to append it; on 3.11 the
+        # transport joins the parts itself, which costs the same as +.
+        self.writer.writelines((text.encode(self.encoding), self.write_separator))
         await self.writer.drain()
 
     def is_open(self) -> bool:
@@ -68,10 +122,11 @@ class Connection:
     async def close(self):
         """Send the quit command text to the game and try to close the connection."""
         self._open = False
-        await self.write(self.quit_command)
+        self.writer.write(self._quit_bytes)
+        await self.writer.drain()
         try:
             self.writer.close()
             await self.writer.wait_closed()
         except Exception as exc:
-            print(exc)
+            log.warning('Error closing connection: %s', exc)
 
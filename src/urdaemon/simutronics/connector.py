@@ -2,12 +2,17 @@ import asyncio
 
 import platform
 
-from urdaemon.simutronics.eaccess import EAccessClient, authenticate
+from urdaemon.simutronics.eaccess import (
+    EAccessClient,
+    authenticate,
+    forget_session,
+)
 from urdaemon.config.loader import load_config
 
-from urdaemon.connection import Connection
+from urdaemon.connection import Connection, open_connection
 
-PROTOCOL: str = f"/FE:WRAYTH /VERSION:1.0.1.26 /P:{platform.system()} /XML\n"
+PROTOCOL: bytes = f"/FE:WRAYTH /VERSION:1.0.1.26 /P:{platform.system()} /XML\n".encode()
+PING: bytes = b"<c>\n"
 
 async def connect(
         account: str = '',
@@ -16,16 +21,22 @@ async def connect(
         character: str = '',
         profile: str = '',
         eaclient: EAccessClient | None = None,
-        read_separator=b'</prompt>\r\n'
+        read_separator=b'</prompt>\r\n',
+        session_max_age: float = 0,
         ) -> Connection:
     """Opens an asyncio connection to the Simutronics server using the
     game feed protocol utilized by Wrayth / Stormfront front-ends.
 
+    Args:
+        session_max_age: Passed to authenticate as max_age to opt in to
+            using a recently obtained session whose key was not yet sent.
+            The session is forgotten as soon as its key is sent.
     """
     if profile:
         conf = load_config()['simutronics']
-        profile_conf = conf['profiles'][profile]
-        profile_conf.setdefault('character', profile)
+        # The loaded config is cached, so build new mappings instead of
+        # mutating it in place.
+        profile_conf = {'character': profile} | conf['profiles'][profile]
         account_key = profile_conf.pop("account")
         account_conf = conf["accounts"][account_key]
         creds = account_conf | profile_conf
@@ -36,17 +47,20 @@ async def connect(
         character = creds['character']
 
     # Authenticate
-    sess = await authenticate(account, password, game, character, client=eaclient)
+    sess = await authenticate(
+        account, password, game, character,
+        client=eaclient, max_age=session_max_age,
+    )
 
-    # Talk to the game server and tell it which protocol to use.
-    reader, writer = await asyncio.open_connection(sess.host, sess.port)
-    writer.write(f"{sess.key}\n".encode())
-    writer.write(PROTOCOL.encode())
+    # Talk to the game server and tell it which protocol to use. The session
+    # key is single use, so it must never be handed out again once sent.
+    forget_session(account, game, character)
+    reader, writer = await open_connection(sess.host, sess.port)
+    writer.writelines((sess.key.encode(), b"\n", PROTOCOL))
 
-    # Need to wait a moment for validation.
-    for _ in range(2):
-        await asyncio.sleep(0.3)
-        writer.write(b"<c>\n")
+    # Need to wait a moment for validation before sending both pings.
+    await asyncio.sleep(0.3)
+    writer.writelines((PING, PING))
     await writer.drain()
 
     # conn = Connection(reader=reader, writer=writer, read_separator=b'</prompt>')
@@ -24,8 +24,10 @@ where the body is a tab separated list of parameters.
 
 """
 import asyncio
-from dataclasses import asdict, dataclass, replace
-from itertools import islice
+import hmac
+import os
+import time
+from dataclasses import asdict, dataclass
 from typing import Iterable
 
 
@@ -60,7 +62,7 @@ class Actions:
     SelectCharacter = "L"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Response:
     """EAccess server response.
 
@@ -85,10 +87,10 @@ class Response:
         Args:
             swap: If the flag is set, assume (value, key) pairs instead.
         """
-        key_start = 0 if not swap else 1
-        val_start = key_start ^ 1
-        vals = self.split()
-        return zip(islice(vals, key_start, None, 2), islice(vals, val_start, None, 2))
+        # Zipping an iterator with itself groups consecutive values.
+        it = iter(self.split())
+        pairs = zip(it, it)
+        return pairs if not swap else ((k, v) for v, k in pairs)
 
     def json(self) -> dict[str, str]:
         """Convert a body consisting of tab separated key=value pairs
@@ -96,10 +98,8 @@ class Response:
         """
         if "=" in self.body:
             parts = (x.partition("=") for x in self.split())
-            jbody = {i[0]: i[2] for i in parts}
-        else:
-            jbody = {k: v for k, v in self.pairs()}
-        return jbody
+            return {k: v for k, _, v in parts}
+        return dict(self.pairs())
 
 
 @dataclass(frozen=True)
@@ -174,6 +174,8 @@ class EAccessClient:
         self.port = port
         self.reader: asyncio.StreamReader
         self.writer: asyncio.StreamWriter
+        # Characters of the selected game, fetched at most once per selection.
+        self._characters: dict[str, str] | None = None
 
     async def connect(self):
         reader, writer = await asyncio.open_connection(self.host, self.port)
@@ -186,14 +188,14 @@ class EAccessClient:
         await self.writer.wait_closed()
 
     async def request(
-        self, action: str, params: list[bytes | str] | None = None
+        self, action: str, params: list[bytes] | None = None
     ) -> Response:
         """Send a request to the EAccess server and wait for a response.
 
         Args:
             action: A single character code denoting the Protocol action.
-            params: A list of parameters to include in the message payload,
-                e.g., the account name and encrypted password.
+            params: A list of encoded parameters to include in the message
+                payload, e.g., the account name and encrypted password.
 
         A typical message is comprised of an action code and a tab
         delimited collection of positional string parameters terminated by
@@ -206,22 +208,17 @@ class EAccessClient:
             action code and trailing newline.
         """
         # Only follow the code with a tab if there are actual arguments.
-        params = params or []
-        params.insert(0, action)
-        msg = (
-            b"\t".join(x if isinstance(x, bytes) else x.encode() for x in params)
-            + b"\n"
-        )
+        msg = b"\t".join([action.encode(), *(params or ())]) + b"\n"
         self.writer.write(msg)
         await self.writer.drain()
 
         raw = await self.reader.readuntil(b"\n")
         resp = raw.decode("ascii")
 
-        # Remove code prefix and subsequent tab if it exists and terminal newline.
-        if resp.startswith(action):
-            resp = resp[1:]
-        resp = resp.strip("\n").strip("\t")
+        # Remove code prefix and subsequent tab if it exists and the terminal
+        # newline, which readuntil always returns as the last character.
+        start = 1 if resp.startswith(action) else 0
+        resp = resp[start:-1].strip("\t")
         return Response(body=resp, request=msg)
 
     @staticmethod
@@ -232,8 +229,10 @@ class EAccessClient:
         Returns:
             The hashed password as a possibly non-decodeable byte array.
         """
+        # Iterating bytes yields ints directly. A list comprehension is
+        # cheaper than feeding bytes() a generator for inputs this small.
         pairs = zip(password.encode(), hashkey.encode())
-        return bytes(((((c - 32) ^ k) + 32) for c, k in pairs))
+        return bytes([((c - 32) ^ k) + 32 for c, k in pairs])
 
     async def get_password_ecryption_key(self) -> str:
         """Get the 32 byte hashkey used to obfuscate the account password."""
@@ -258,9 +257,10 @@ class EAccessClient:
             Account login key.
 
         """
+        self._characters = None
         encryption_key = await self.get_password_ecryption_key()
         encrypted_pw = self.encrypt_password(password, encryption_key)
-        params = [account, encrypted_pw]
+        params = [account.encode(), encrypted_pw]
         resp = await self.request(Actions.AuthenticateAccount, params)
         if "KEY" not in resp.body:
             raise AuthenticationError(resp)
@@ -283,7 +283,8 @@ class EAccessClient:
             A dict containing game info.
         """
         code = game.code if isinstance(game, GameInfo) else game
-        resp = await self.request(Actions.SelectGame, [code])
+        self._characters = None
+        resp = await self.request(Actions.SelectGame, [code.encode()])
         return resp.json()
 
     async def get_characters(self) -> dict[str, str]:
@@ -295,11 +296,18 @@ class EAccessClient:
         3. ?
         4. ?
 
+        The mapping is cached until another game is selected, and callers
+        receive a copy of it.
+
         Returns:
             A map of character name -> character code.
         """
-        resp = await self.request(Actions.GetCharacters)
-        return {k: v for i, (v, k) in enumerate(resp.pairs()) if i > 1}
+        if self._characters is None:
+            resp = await self.request(Actions.GetCharacters)
+            # Skip the metadata, then pair each name with the preceding code.
+            vals = resp.split()
+            self._characters = dict(zip(vals[5::2], vals[4::2]))
+        return dict(self._characters)
 
     async def select_character(
         self, character: str, frontend: str = "STORM"
@@ -335,7 +343,11 @@ class EAccessClient:
 
         """
         characters = await self.get_characters()
-        character_code = characters.get(character.title())
+        # Names are usually passed as the server lists them, so only
+        # titlecase on a miss.
+        character_code = characters.get(character) or characters.get(
+            character.title()
+        )
         if character_code is None:
             raise AuthenticationError(f"Unknown character {character}.")
 
@@ -343,12 +355,15 @@ class EAccessClient:
         # We might want to only support STORM
         resp = await self.request(
             action=Actions.SelectCharacter,
-            params=[character_code, frontend],
+            params=[character_code.encode(), frontend.encode()],
         )
 
-        # Fix body to contain "=" separated keys.
-        resp = replace(resp, body=resp.body.replace("OK\t", "OK=1\t"))
-        jresp = resp.json()
+        # Parse the key=value pairs in one pass, treating bare keys such as
+        # the leading OK as flags.
+        jresp = {
+            k: v if sep else "1"
+            for k, sep, v in (x.partition("=") for x in resp.split())
+        }
 
         return SessionInfo(
             host=jresp["GAMEHOST"],
@@ -377,23 +392,67 @@ class EAccessClient:
     #     return await self.select_character(character)
 
 
+# Sessions obtained by authenticate whose keys may still be unused, keyed by
+# (account, game, character) and mapped to (monotonic time, password digest,
+# session). The digest ensures a different password never reuses a session
+# without keeping the password. Entries are handed out at most once.
+_session_cache: dict[tuple[str, str, str], tuple[float, bytes, SessionInfo]] = {}
+_session_secret: bytes = os.urandom(32)
+
+
+def _password_digest(password: str) -> bytes:
+    return hmac.digest(_session_secret, password.encode(), "sha256")
+
+
+def forget_session(account: str, game: str, character: str):
+    """Drop the reusable session for a profile. Must be called once the
+    session key is sent to the game server, since keys are single use."""
+    _session_cache.pop((account, game, character), None)
+
+
 async def authenticate(
     account: str,
     password: str,
     game: str,
     character: str,
     client: EAccessClient | None = None,
+    max_age: float = 0,
 ) -> SessionInfo:
     """Authenticate a character login session.
 
+    Args:
+        client: The client used to run the protocol. Supplying a client
+            always runs the protocol.
+        max_age: If positive, remember the session and reuse the one
+            previously obtained for the same profile when it is at most this
+            many seconds old rather than running the protocol again. A
+            remembered session is returned at most once, and callers that
+            send its key to the game server must call forget_session.
+
     Returns:
         Game session connection details such as host, port, and session key
         that are used to establish a socket connection to the game server.
     """
+    profile = (account, game, character)
+    if max_age > 0 and client is None:
+        cached = _session_cache.pop(profile, None)
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] <= max_age
+            and hmac.compare_digest(cached[1], _password_digest(password))
+        ):
+            return cached[2]
+
     client = client or EAccessClient()
     await client.connect()
     await client.authenticate_account(account, password)
     await client.select_game(game)
     session_info = await client.select_character(character)
     await client.close()
+    if max_age > 0:
+        _session_cache[profile] = (
+            time.monotonic(),
+            _password_digest(password),
+            session_info,
+        )
     return session_info
@@ -0,0 +1,73 @@
+import asyncio
+
+from urdaemon.connection import Connection, open_connection
+
+
+def read_messages(chunks: list[bytes], count: int, **kwargs) -> list[str]:
+    """Feed the chunks to a reader and read count messages from it."""
+
+    async def run():
+        reader = asyncio.StreamReader()
+        for chunk in chunks:
+            reader.feed_data(chunk)
+        reader.feed_eof()
+        conn = Connection(reader, None, **kwargs)
+        return [await conn.read() for _ in range(count)]
+
+    return asyncio.run(run())
+
+
+def test_read_splits_on_separator_across_chunks():
+    sep = b'</prompt>\r\n'
+    msgs = read_messages(
+        [b'one</pro', b'mpt>\r\ntwo', b'</prompt>\r\nthree</prompt>\r\n'],
+        3,
+        read_separator=sep,
+    )
+    assert msgs == ['one</prompt>\r\n', 'two</prompt>\r\n', 'three</prompt>\r\n']
+
+
+def test_read_decodes_utf8():
+    assert read_messages(['café\r\n'.encode()], 1) == ['café\r\n']
+
+
+def test_read_falls_back_to_repr_on_decode_error():
+    assert read_messages([b'\xff\r\n'], 1) == [str(b'\xff\r\n')]
+
+
+def test_read_returns_empty_at_eof():
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(b'partial')
+        reader.feed_eof()
+        conn = Connection(reader, None)
+        return await conn.read(), conn._open
+
+    assert asyncio.run(run()) == ('', False)
+
+
+def test_write_and_close_over_buffered_connection():
+    async def run():
+        received = []
+
+        async def handle(reader, writer):
+            writer.write(b'hello\r\nworld\r\n')
+            await writer.drain()
+            while line := await reader.readline():
+                received.append(line)
+            writer.close()
+
+        server = await asyncio.start_server(handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await open_connection('127.0.0.1', port)
+            conn = Connection(reader, writer)
+            msgs = [await conn.read(), await conn.read()]
+            await conn.write('look')
+            await conn.close()
+            await asyncio.sleep(0.05)
+        return msgs, received
+
+    msgs, received = asyncio.run(run())
+    assert msgs == ['hello\r\n', 'world\r\n']
+    assert received == [b'look\r\n', b'exit\r\n']
@@ -0,0 +1,153 @@
+import asyncio
+import time
+
+import pytest
+
+from urdaemon.simutronics import eaccess
+from urdaemon.simutronics.connector import connect
+from urdaemon.simutronics.eaccess import (
+    EAccessClient,
+    SessionInfo,
+    authenticate,
+    forget_session,
+)
+
+
+def exchange(replies: dict[bytes, list[bytes]], action: str, params=None):
+    """Send one request to a fake EAccess server that writes the reply
+    chunks registered for the request's action code."""
+
+    async def run():
+        received = []
+
+        async def handle(reader, writer):
+            line = await reader.readuntil(b"\n")
+            received.append(line)
+            for chunk in replies[line[:1]]:
+                writer.write(chunk)
+                await writer.drain()
+                await asyncio.sleep(0)
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            client = EAccessClient("127.0.0.1", port)
+            await client.connect()
+            resp = await client.request(action, params)
+            await client.close()
+        return resp, received
+
+    return asyncio.run(run())
+
+
+def test_request_strips_action_and_newline():
+    resp, received = exchange({b"K": [b"K\tabcdefgh", b"ijklmnop\n"]}, "K")
+    assert received == [b"K\n"]
+    assert resp.body == "abcdefghijklmnop"
+    assert resp.request == b"K\n"
+
+
+def test_request_joins_params_with_tabs():
+    resp, received = exchange(
+        {b"A": [b"A\tACCOUNT\tKEY\tdeadbeef\tNAME\n"]},
+        "A",
+        [b"ACCOUNT", b"\x01\x02"],
+    )
+    assert received == [b"A\tACCOUNT\t\x01\x02\n"]
+    assert resp.split() == ["ACCOUNT", "KEY", "deadbeef", "NAME"]
+
+
+def test_request_without_echoed_action():
+    resp, _ = exchange({b"M": [b"GS3\tGemStone IV\n"]}, "M")
+    assert resp.json() == {"GS3": "GemStone IV"}
+
+
+class FakeClient:
+    """Stands in for EAccessClient, issuing a new session key per login."""
+
+    logins = 0
+    host = "127.0.0.1"
+    port = 0
+
+    async def connect(self):
+        pass
+
+    async def authenticate_account(self, account, password):
+        pass
+
+    async def select_game(self, game):
+        pass
+
+    async def select_character(self, character):
+        FakeClient.logins += 1
+        return SessionInfo(host=self.host, port=self.port, key=f"key{self.logins}")
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fake_client(monkeypatch):
+    FakeClient.logins = 0
+    monkeypatch.setattr(eaccess, "EAccessClient", FakeClient)
+    monkeypatch.setattr(eaccess, "_session_cache", {})
+    return FakeClient
+
+
+def login(password="pw", **kwargs):
+    return asyncio.run(authenticate("acct", password, "GS3", "char", **kwargs))
+
+
+def test_sessions_are_not_reused_by_default():
+    assert login().key == "key1"
+    assert login().key == "key2"
+
+
+def test_session_is_reused_once_within_max_age():
+    assert login(max_age=60).key == "key1"
+    assert login(max_age=60).key == "key1"
+    assert login(max_age=60).key == "key2"
+
+
+def test_expired_session_is_not_reused():
+    assert login(max_age=0.01).key == "key1"
+    time.sleep(0.02)
+    assert login(max_age=0.01).key == "key2"
+
+
+def test_different_password_is_not_reused():
+    assert login(max_age=60).key == "key1"
+    assert login("other", max_age=60).key == "key2"
+
+
+def test_supplied_client_always_authenticates():
+    assert login(max_age=60).key == "key1"
+    assert login(max_age=60, client=FakeClient()).key == "key2"
+
+
+def test_forget_session():
+    assert login(max_age=60).key == "key1"
+    forget_session("acct", "GS3", "char")
+    assert login(max_age=60).key == "key2"
+
+
+def test_connect_never_resends_a_session_key(monkeypatch):
+    async def run():
+        keys = []
+
+        async def handle(reader, writer):
+            keys.append(await reader.readuntil(b"\n"))
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        monkeypatch.setattr(FakeClient, "port", port)
+        async with server:
+            for _ in range(2):
+                conn = await connect("acct", "pw", "GS3", "char", session_max_age=60)
+                conn.writer.close()
+            await asyncio.sleep(0.05)
+        return keys
+
+    assert asyncio.run(run()) == [b"key1\n", b"key2\n"]